@@ -14,7 +14,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator, Mapping, NoReturn, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
+    Mapping,
+    NoReturn,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from streamlit.errors import StreamlitAPIException
 from streamlit.runtime.scriptrunner_utils.script_run_context import (
@@ -24,6 +33,8 @@ from streamlit.runtime.scriptrunner_utils.script_run_context import (
 if TYPE_CHECKING:
     from streamlit.runtime.scriptrunner_utils.script_run_context import UserInfo
 
+T = TypeVar("T")
+
 
 def _get_user_info() -> UserInfo:
     ctx = _get_script_run_ctx()
@@ -62,6 +73,8 @@ class UserInfoProxy(Mapping[str, Union[str, None]]):
 
     """
 
+    __slots__ = ()
+
     def __getitem__(self, key: str) -> str | None:
         return _get_user_info()[key]
 
@@ -83,6 +96,22 @@ class UserInfoProxy(Mapping[str, Union[str, None]]):
     def __len__(self) -> int:
         return len(_get_user_info())
 
+    # __contains__ and get are also provided by the Mapping mixin, but going
+    # through the underlying dict directly is faster. keys/values/items are
+    # left to the mixin so that views keep reading from the current context.
+
+    def __contains__(self, key: object) -> bool:
+        return key in _get_user_info()
+
+    @overload
+    def get(self, key: str, /) -> str | None: ...
+
+    @overload
+    def get(self, key: str, /, default: str | None | T) -> str | None | T: ...
+
+    def get(self, key: str, /, default: Any = None) -> Any:
+        return _get_user_info().get(key, default)
+
     def to_dict(self) -> UserInfo:
         """
         Get user info as a dictionary.
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import threading
+from collections.abc import Mapping
 
 import streamlit as st
 from streamlit.errors import StreamlitAPIException
@@ -89,11 +90,42 @@ class UserInfoProxyTest(DeltaGeneratorTestCase):
     def test_user_len(self):
         self.assertEqual(len(st.experimental_user), 1)
 
+    def test_user_contains(self):
+        self.assertIn("email", st.experimental_user)
+        self.assertNotIn("key", st.experimental_user)
+
+    def test_user_get(self):
+        self.assertEqual(st.experimental_user.get("email"), "test@example.com")
+        self.assertIsNone(st.experimental_user.get("key"))
+        self.assertEqual(st.experimental_user.get("key", "default"), "default")
+
+    def test_user_keys_values_items(self):
+        self.assertEqual(list(st.experimental_user.keys()), ["email"])
+        self.assertEqual(list(st.experimental_user.values()), ["test@example.com"])
+        self.assertEqual(
+            list(st.experimental_user.items()), [("email", "test@example.com")]
+        )
+
+    def test_user_has_no_instance_dict(self):
+        """Test that UserInfoProxy uses __slots__ and carries no __dict__."""
+        self.assertFalse(hasattr(st.experimental_user, "__dict__"))
+
+    def test_user_is_mapping(self):
+        """Test that UserInfoProxy is a Mapping."""
+        self.assertIsInstance(st.experimental_user, Mapping)
+
+    def test_user_eq(self):
+        self.assertEqual(st.experimental_user, {"email": "test@example.com"})
+        self.assertNotEqual(st.experimental_user, {"email": "bar@example.com"})
+        self.assertNotEqual(st.experimental_user, "test@example.com")
+
     def test_st_user_reads_from_context_(self):
         """Test that st.user reads information from current ScriptRunContext
         And after ScriptRunContext changed, it returns new email
         """
         orig_report_ctx = get_script_run_ctx()
+        user_info_keys = st.experimental_user.keys()
+        user_info_values = st.experimental_user.values()
 
         forward_msg_queue = ForwardMsgQueue()
 
@@ -107,13 +139,16 @@ class UserInfoProxyTest(DeltaGeneratorTestCase):
                     session_state=SafeSessionState(SessionState(), lambda: None),
                     uploaded_file_mgr=None,
                     main_script_path="",
-                    user_info={"email": "something@else.com"},
+                    user_info={"email": "something@else.com", "name": "Some One"},
                     fragment_storage=MemoryFragmentStorage(),
                     pages_manager=PagesManager(""),
                 ),
             )
 
             self.assertEqual(st.experimental_user.email, "something@else.com")
+            # Views obtained before the context changed read from the new one.
+            self.assertEqual(list(user_info_keys), ["email", "name"])
+            self.assertEqual(list(user_info_values), ["something@else.com", "Some One"])
         except Exception as e:
             raise e
         finally: